@@ -15,6 +15,11 @@ try:
 except Exception:
     DND_AVAILABLE = False
 
+DEBUG = "--debug" in sys.argv or bool(os.environ.get("STEAMTOOLS_DEBUG"))
+
+# One UI frame; refresh requests arriving within this window are merged.
+REFRESH_DELAY_MS = 16
+
 def find_steam_path():
     try:
         import winreg
@@ -416,6 +421,11 @@ class SteamtoolsApp:
 
         current_type = tk.StringVar(value="lua")
         selected_game = {"appid": None, "name": None, "depot_ids": set()}
+        refresh_state = {
+            "files": False, "games": False, "pending": None,
+            "requested": 0, "executed": 0, "skipped": 0,
+        }
+        rendered = {"files": None, "games": None}
 
         # --- Top row: tabs + clear selection ---
         topbar = tk.Frame(panel, bg=self.PANEL)
@@ -444,7 +454,7 @@ class SteamtoolsApp:
                 game_list.selection_clear(0, "end")
             except Exception:
                 pass
-            refresh_files_list()
+            request_refresh(files=True)
 
         clear_btn = self.btn(topbar, "Clear", clear_game_selection)
         clear_btn.configure(padx=10, pady=8, font=("Segoe UI", 9, "bold"))
@@ -500,6 +510,11 @@ class SteamtoolsApp:
         tk.Label(frame, textvariable=status_var, bg=self.BG, fg=self.MUTED,
                  font=("Segoe UI", 9)).pack(pady=(6, 0))
 
+        debug_var = tk.StringVar(value="")
+        if DEBUG:
+            tk.Label(frame, textvariable=debug_var, bg=self.BG, fg=self.MUTED,
+                     font=("Segoe UI", 8)).pack()
+
         # --- Action row inside panel: Uninstall + Back + Restart Steam ---
         action_row = tk.Frame(panel, bg=self.PANEL)
         action_row.pack(fill="x", padx=16, pady=(10, 16))
@@ -546,15 +561,52 @@ class SteamtoolsApp:
                 return all_m
             return out
 
+        def update_debug():
+            if DEBUG:
+                debug_var.set(
+                    f"Refresh requested: {refresh_state['requested']} | "
+                    f"executed: {refresh_state['executed']} | "
+                    f"unchanged: {refresh_state['skipped']}"
+                )
+
+        def request_refresh(files=False, games=False):
+            refresh_state["files"] = refresh_state["files"] or files
+            refresh_state["games"] = refresh_state["games"] or games
+            refresh_state["requested"] += int(files) + int(games)
+            if refresh_state["pending"] is None:
+                refresh_state["pending"] = frame.after(REFRESH_DELAY_MS, flush_refresh)
+            update_debug()
+
+        def flush_refresh():
+            refresh_state["pending"] = None
+            do_files, do_games = refresh_state["files"], refresh_state["games"]
+            refresh_state["files"] = refresh_state["games"] = False
+            if do_games:
+                refresh_game_list()
+            if do_files:
+                refresh_files_list()
+            update_debug()
+
+        def flush_pending():
+            if refresh_state["pending"] is not None:
+                frame.after_cancel(refresh_state["pending"])
+                flush_refresh()
+
         def refresh_files_list():
-            files_list.delete(0, "end")
             if current_type.get() == "lua":
                 items = list_lua_files_filtered()
             else:
                 items = list_manifest_files_filtered()
 
-            for x in items:
-                files_list.insert("end", x)
+            key = (current_type.get(), tuple(items))
+            if key == rendered["files"]:
+                refresh_state["skipped"] += 1
+            else:
+                rendered["files"] = key
+                refresh_state["executed"] += 1
+                files_list.delete(0, "end")
+                for x in items:
+                    files_list.insert("end", x)
 
             if current_type.get() == "manifest" and selected_game["name"]:
                 status_var.set(f"Found: {len(items)} (filtered by: {selected_game['name']})")
@@ -567,7 +619,6 @@ class SteamtoolsApp:
           
             games = ensure_games_index()
 
-            game_list.delete(0, "end")
             matches = []
 
             for g in games:
@@ -586,6 +637,14 @@ class SteamtoolsApp:
                 matches.append(g)
 
             matches = matches[:400]
+            key = tuple((g["appid"], g["name"]) for g in matches)
+            if key == rendered["games"]:
+                refresh_state["skipped"] += 1
+                return
+
+            rendered["games"] = key
+            refresh_state["executed"] += 1
+            game_list.delete(0, "end")
             game_list._matches = matches
             for g in matches:
                 game_list.insert("end", g["name"])
@@ -602,7 +661,7 @@ class SteamtoolsApp:
             selected_game["appid"] = g["appid"]
             selected_game["name"] = g["name"]
             selected_game["depot_ids"] = set(g.get("depot_ids", set()))
-            refresh_files_list()
+            request_refresh(files=True)
 
         def set_tab(which: str):
             current_type.set(which)
@@ -612,9 +671,10 @@ class SteamtoolsApp:
             else:
                 man_tab.configure(bg=self.CARD, fg=self.TEXT)
                 lua_tab.configure(bg=self.PANEL, fg=self.MUTED)
-            refresh_files_list()
+            request_refresh(files=True)
 
         def uninstall_selected_one():
+            flush_pending()
             sel = files_list.curselection()
             if not sel:
                 status_var.set("Select a file first.")
@@ -633,8 +693,7 @@ class SteamtoolsApp:
             except Exception as e:
                 status_var.set(f"Failed: {e}")
 
-            refresh_files_list()
-            refresh_game_list()
+            request_refresh(files=True, games=True)
 
         lua_tab.bind("<Button-1>", lambda e: set_tab("lua"))
         man_tab.bind("<Button-1>", lambda e: set_tab("manifest"))
@@ -645,8 +704,8 @@ class SteamtoolsApp:
         self.btn(action_row, "Restart Steam", lambda: restart_steam_silent(self.steam_path)).pack(side="left", padx=8)
 
         set_tab("lua")
-        refresh_game_list()
-        refresh_files_list()
+        request_refresh(games=True)
+        flush_pending()
 
         return frame
 